@@ -2,60 +2,137 @@
 
 import subprocess
 import time
-import requests
-from datetime import datetime
 import os
 import sys
 import platform
+import shutil
 import logging
 import signal
+import atexit
+import threading
+import queue
+import collections
 from abc import ABC, abstractmethod
-from dotenv import load_dotenv
-from daemoniker import Daemonizer, SignalHandler1
-
-# Global configuration variables
-GOTIFY_SERVER_URL = None
-GOTIFY_TOKEN = None
-HIGH_TEMPERATURE_THRESHOLD = None
-CRITICAL_TEMPERATURE_THRESHOLD = None
-CHECK_INTERVAL_SECONDS = None
-EMERGENCY_SHUTDOWN_DURATION_SECONDS = None
-PID_FILE = None
-
-def load_environment(logger: logging.Logger):
-    """Load environment variables from .env file. The file must exist and contain all required variables."""
-    global GOTIFY_SERVER_URL, GOTIFY_TOKEN, HIGH_TEMPERATURE_THRESHOLD, \
-           CRITICAL_TEMPERATURE_THRESHOLD, CHECK_INTERVAL_SECONDS, \
-           EMERGENCY_SHUTDOWN_DURATION_SECONDS, PID_FILE
+from dataclasses import dataclass
+from urllib.parse import urlparse
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(script_dir)
-    
-    # Look for exactly .env file in script directory or parent directory
-    env_path = None
-    for dir_path in [script_dir, parent_dir]:
-        test_path = os.path.join(dir_path, '.env')
-        if os.path.isfile(test_path) and os.path.basename(test_path) == '.env':
-            env_path = test_path
-            break
+# Platform the monitor runs on, looked up once at import time
+_SYSTEM = platform.system()
 
-    if env_path is None:
-        logger.error(f"Required .env file not found in {script_dir} or {parent_dir}")
+# pywin32 is only installed and needed on Windows
+if _SYSTEM == "Windows":
+    import pywintypes
+    import win32api
+    import win32con
+    import win32evtlog
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    import json
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Connect and read timeouts for requests to the Gotify server
+GOTIFY_TIMEOUT_SECONDS = (2, 5)
+
+# How long the NVML event watcher blocks inside a single wait call
+NVML_EVENT_WAIT_TIMEOUT_MS = 60_000
+
+# Consecutive failed notifications after which sending pauses, and the longest pause
+NOTIFY_BREAKER_THRESHOLD = 3
+NOTIFY_BREAKER_MAX_BACKOFF_SECONDS = 60
+
+# How long to wait for queued notifications to be sent before shutting down
+NOTIFICATION_FLUSH_TIMEOUT_SECONDS = 10
+
+# Poll at the configured interval only within this many degrees of the high threshold
+ADAPTIVE_INTERVAL_MARGIN_CELSIUS = 10
+
+# How much longer the check interval is while the GPU is well below the high threshold
+COOL_INTERVAL_MULTIPLIER = 4
+
+# How long get_temperatures() shares a reading between callers. The monitor loop always reads fresh.
+TEMPERATURE_CACHE_TTL_SECONDS = 1.0
+
+# GPU metrics collected by a single query on every check, in nvidia-smi --query-gpu order
+GPU_METRIC_FIELDS = ("temperature.gpu", "power.draw", "utilization.gpu", "memory.used")
+
+def parse_metric_value(value: bytes) -> int | float | None:
+    """Parse one nvidia-smi nounits CSV value. Unavailable metrics like [N/A] become None."""
+    if value.startswith(b"["):
+        return None
+    return float(value) if b"." in value else int(value)
+
+@dataclass(frozen=True, slots=True)
+class GotifyConfig:
+    """Validated Gotify connection settings"""
+    url: str
+    token: str
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Typed monitor configuration, parsed once from the .env file and passed to the daemon"""
+    gotify: GotifyConfig
+    high_temperature_threshold: int
+    critical_temperature_threshold: int
+    check_interval_seconds: int
+    min_check_interval_seconds: int
+    max_check_interval_seconds: int
+    emergency_shutdown_duration_seconds: int
+    notify_min_interval_seconds: int
+    notify_batch_window_seconds: float
+    pid_file: str
+
+    @property
+    def hot_check_interval_seconds(self) -> int:
+        """Check interval near or above the high threshold, clamped to the configured limits"""
+        return min(max(self.check_interval_seconds, self.min_check_interval_seconds), self.max_check_interval_seconds)
+
+    @property
+    def cool_check_interval_seconds(self) -> int:
+        """Longer check interval used while the GPU is well below the high threshold"""
+        return min(max(self.check_interval_seconds * COOL_INTERVAL_MULTIPLIER, self.hot_check_interval_seconds),
+                   self.max_check_interval_seconds)
+
+@dataclass(slots=True)
+class PendingNotification:
+    """A queued notification and the repeats of the same title merged into it"""
+    message: str
+    priority: int
+    max_temperature: int | None
+    first_queued: float
+    count: int = 1
+
+def _parse_env_file(path: str) -> dict:
+    """Parse the .env file once. Its values take precedence over the process environment."""
+    from dotenv import dotenv_values
+
+    values = dict(os.environ)
+    values.update((key, value) for key, value in dotenv_values(path).items() if value is not None)
+    return values
+
+def load_gotify_config(url: str, token: str, logger: logging.Logger) -> GotifyConfig:
+    """Validate the Gotify settings once at startup instead of failing on every notification"""
+    parsed_url = urlparse(url.strip().rstrip("/"))
+    if parsed_url.scheme not in ("http", "https") or not parsed_url.netloc:
+        logger.error(f"Invalid value for GOTIFY_SERVER_URL: must be an http(s) URL, got {url!r}")
         sys.exit(1)
 
-    logger.info(f"Loading environment from {env_path}")
-    load_dotenv(env_path, override=True)
+    if not token.strip():
+        logger.error("Invalid value for GOTIFY_TOKEN: must not be empty")
+        sys.exit(1)
 
-    # Set PID file location based on platform
-    if platform.system() == "Windows":
-        PID_FILE = os.path.join("C:\\ProgramData", "GPUTempMonitor", "gpu_monitor.pid")
-        # Create directory for PID file if it doesn't exist
-        os.makedirs(os.path.dirname(PID_FILE), exist_ok=True)
-    else:
-        # On Linux, when running as a service, systemd will handle the PID file
-        PID_FILE = "/run/gpu-monitor.pid"
-        # Don't try to create the directory on Linux as it's managed by systemd
+    return GotifyConfig(parsed_url.geturl(), token.strip())
 
+def _apply_config(values: dict, logger: logging.Logger) -> Config:
+    """Validate the parsed variables and convert them into a Config"""
     # Load required configuration
     required_vars = {
         "GOTIFY_SERVER_URL": str,
@@ -66,17 +143,16 @@ def load_environment(logger: logging.Logger):
         "EMERGENCY_SHUTDOWN_DURATION_SECONDS": int
     }
 
+    settings = {}
     missing_vars = []
     for var_name, var_type in required_vars.items():
-        value = os.getenv(var_name)
+        value = values.get(var_name)
         if value is None:
             missing_vars.append(var_name)
             continue
         
         try:
-            if var_type == int:
-                value = int(value)
-            globals()[var_name] = value
+            settings[var_name.lower()] = var_type(value)
         except ValueError:
             logger.error(f"Invalid value for {var_name}: must be {var_type.__name__}")
             sys.exit(1)
@@ -85,28 +161,83 @@ def load_environment(logger: logging.Logger):
         logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
         sys.exit(1)
 
+    # Load optional configuration, falling back to the defaults
+    optional_vars = {
+        "NOTIFY_MIN_INTERVAL_SECONDS": (int, 60),
+        "NOTIFY_BATCH_WINDOW_SECONDS": (float, 2.0),
+        "MIN_CHECK_INTERVAL_SECONDS": (int, 1),
+        "MAX_CHECK_INTERVAL_SECONDS": (int, 300)
+    }
+
+    for var_name, (var_type, default) in optional_vars.items():
+        value = values.get(var_name)
+        if value is None:
+            settings[var_name.lower()] = default
+            continue
+
+        try:
+            settings[var_name.lower()] = var_type(value)
+        except ValueError:
+            logger.error(f"Invalid value for {var_name}: must be {var_type.__name__}")
+            sys.exit(1)
+
+    if settings["min_check_interval_seconds"] > settings["max_check_interval_seconds"]:
+        logger.error("Invalid value for MIN_CHECK_INTERVAL_SECONDS: must not exceed MAX_CHECK_INTERVAL_SECONDS")
+        sys.exit(1)
+
+    # Set PID file location based on platform
+    if _SYSTEM == "Windows":
+        pid_file = os.path.join("C:\\ProgramData", "GPUTempMonitor", "gpu_monitor.pid")
+        # Create directory for PID file if it doesn't exist
+        os.makedirs(os.path.dirname(pid_file), exist_ok=True)
+    else:
+        # On Linux, when running as a service, systemd will handle the PID file
+        pid_file = "/run/gpu-monitor.pid"
+        # Don't try to create the directory on Linux as it's managed by systemd
+
+    gotify = load_gotify_config(settings.pop("gotify_server_url"), settings.pop("gotify_token"), logger)
+    return Config(gotify=gotify, pid_file=pid_file, **settings)
+
+def load_environment(logger: logging.Logger) -> Config:
+    """Load the configuration from the .env file. The file must exist and contain all required variables."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(script_dir)
+    
+    # Look for exactly .env file in script directory or parent directory
+    env_path = None
+    for dir_path in [script_dir, parent_dir]:
+        test_path = os.path.join(dir_path, '.env')
+        if os.path.isfile(test_path) and os.path.basename(test_path) == '.env':
+            env_path = test_path
+            break
+
+    if env_path is None:
+        logger.error(f"Required .env file not found in {script_dir} or {parent_dir}")
+        sys.exit(1)
+
+    logger.info(f"Loading environment from {env_path}")
+    config = _apply_config(_parse_env_file(env_path), logger)
+
     logger.info("Loaded configuration:")
-    logger.info(f"  High temperature threshold: {HIGH_TEMPERATURE_THRESHOLD}°C")
-    logger.info(f"  Critical temperature threshold: {CRITICAL_TEMPERATURE_THRESHOLD}°C")
-    logger.info(f"  Check interval: {CHECK_INTERVAL_SECONDS} seconds")
-    logger.info(f"  Emergency shutdown duration: {EMERGENCY_SHUTDOWN_DURATION_SECONDS} seconds")
+    logger.info(f"  High temperature threshold: {config.high_temperature_threshold}°C")
+    logger.info(f"  Critical temperature threshold: {config.critical_temperature_threshold}°C")
+    logger.info(f"  Check interval: {config.check_interval_seconds} seconds")
+    logger.info(f"  Check interval limits: {config.min_check_interval_seconds}-{config.max_check_interval_seconds} seconds")
+    logger.info(f"  Emergency shutdown duration: {config.emergency_shutdown_duration_seconds} seconds")
+    logger.info(f"  Minimum interval between repeated alerts: {config.notify_min_interval_seconds} seconds")
+    logger.info(f"  Notification batch window: {config.notify_batch_window_seconds} seconds")
     logger.info("  Gotify notifications: Enabled")
+    return config
 
 class SystemLogger(ABC):
+    __slots__ = ()
+
     @classmethod
     def create(cls) -> 'SystemLogger':
         """Factory method to create the appropriate logger for the current platform"""
-        system = platform.system()
-        logger_map = {
-            "Windows": WindowsSystemLogger,
-            "Linux": LinuxSystemLogger
-        }
-        
-        logger_class = logger_map.get(system)
-        if logger_class is None:
-            raise NotImplementedError(f"No logger implementation for platform: {system}")
-        
-        return logger_class()
+        if _SYSTEM_LOGGER_CLASS is None:
+            raise NotImplementedError(f"No logger implementation for platform: {_SYSTEM}")
+        return _SYSTEM_LOGGER_CLASS()
 
     @abstractmethod
     def setup(self, logger: logging.Logger) -> None:
@@ -114,14 +245,9 @@ class SystemLogger(ABC):
         pass
 
 class WindowsSystemLogger(SystemLogger):
+    __slots__ = ()
+
     def setup(self, logger: logging.Logger) -> None:
-        import win32evtlog
-        import win32evtlogutil
-        import win32con
-        import win32api
-        import win32security
-        import pywintypes
-        
         # Try to register the event source in the registry, but continue even if it fails
         try:
             # Get path to the current Python executable
@@ -143,33 +269,36 @@ class WindowsSystemLogger(SystemLogger):
             logger.warning(f"Could not register event source (this is normal if not running as admin or if already registered): {e}")
         
         class WindowsEventLogHandler(logging.Handler):
+            # Event log type for each logging level, built once instead of on every record
+            _LEVEL_MAP = {
+                logging.DEBUG: win32evtlog.EVENTLOG_INFORMATION_TYPE,
+                logging.INFO: win32evtlog.EVENTLOG_INFORMATION_TYPE,
+                logging.WARNING: win32evtlog.EVENTLOG_WARNING_TYPE,
+                logging.ERROR: win32evtlog.EVENTLOG_ERROR_TYPE,
+                logging.CRITICAL: win32evtlog.EVENTLOG_ERROR_TYPE
+            }
+
             def __init__(self):
                 super().__init__()
                 self.source_name = "GPU Monitor"
-                # Try to open the event log once to validate the source exists
+                # Open the event source once and keep it for the lifetime of the handler,
+                # which also validates that the source exists
+                self._handle = None
                 try:
-                    handle = win32evtlog.RegisterEventSource(None, self.source_name)
-                    win32evtlog.DeregisterEventSource(handle)
+                    self._handle = win32evtlog.RegisterEventSource(None, self.source_name)
                 except pywintypes.error as e:
                     logger.warning(f"Event source validation failed: {e}")
 
             def emit(self, record):
                 try:
-                    level_map = {
-                        logging.DEBUG: win32evtlog.EVENTLOG_INFORMATION_TYPE,
-                        logging.INFO: win32evtlog.EVENTLOG_INFORMATION_TYPE,
-                        logging.WARNING: win32evtlog.EVENTLOG_WARNING_TYPE,
-                        logging.ERROR: win32evtlog.EVENTLOG_ERROR_TYPE,
-                        logging.CRITICAL: win32evtlog.EVENTLOG_ERROR_TYPE
-                    }
-                    
                     msg = self.format(record)
-                    event_type = level_map.get(record.levelno, win32evtlog.EVENTLOG_INFORMATION_TYPE)
+                    event_type = self._LEVEL_MAP.get(record.levelno, win32evtlog.EVENTLOG_INFORMATION_TYPE)
                     
                     try:
-                        handle = win32evtlog.RegisterEventSource(None, self.source_name)
+                        if self._handle is None:
+                            self._handle = win32evtlog.RegisterEventSource(None, self.source_name)
                         win32evtlog.ReportEvent(
-                            handle,         # Event log handle
+                            self._handle,   # Event log handle
                             event_type,     # Event Type
                             0,             # Event Category
                             0,             # Event ID
@@ -177,43 +306,245 @@ class WindowsSystemLogger(SystemLogger):
                             [msg],         # Strings
                             b""           # Raw data (empty bytes)
                         )
-                        win32evtlog.DeregisterEventSource(handle)
                     except pywintypes.error as e:
                         # Since we can't log to event log, and we don't want console output,
-                        # we'll have to silently fail here
-                        pass
+                        # we'll have to silently fail here. Reopen the event source on the next record.
+                        self.release_handle()
                 except Exception:
                     self.handleError(record)
+
+            def release_handle(self):
+                handle, self._handle = self._handle, None
+                if handle is not None:
+                    try:
+                        win32evtlog.DeregisterEventSource(handle)
+                    except pywintypes.error:
+                        pass
+
+            def close(self):
+                self.acquire()
+                try:
+                    self.release_handle()
+                finally:
+                    self.release()
+                super().close()
         
         # Add only event log handler, no console handler
         event_handler = WindowsEventLogHandler()
         event_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+        event_handler.setLevel(logging.INFO)
         logger.addHandler(event_handler)
 
 class LinuxSystemLogger(SystemLogger):
+    __slots__ = ()
+
     def setup(self, logger: logging.Logger) -> None:
-        from systemd.journal import JournalHandler
+        from systemd.journal import JournalHandler, sendv
+
+        class SendvJournalHandler(JournalHandler):
+            """Journal handler that passes pre-encoded fields straight to sd_journal_sendv"""
+            SYSLOG_IDENTIFIER_FIELD = b"SYSLOG_IDENTIFIER=gpu-monitor"
+            PRIORITY_FIELDS = {
+                level: b"PRIORITY=%d" % JournalHandler.map_priority(level)
+                for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+            }
+
+            def emit(self, record):
+                try:
+                    priority = self.PRIORITY_FIELDS.get(record.levelno)
+                    if priority is None:
+                        priority = b"PRIORITY=%d" % self.map_priority(record.levelno)
+                    sendv(b"MESSAGE=" + self.format(record).encode(), priority, self.SYSLOG_IDENTIFIER_FIELD)
+                except Exception:
+                    self.handleError(record)
         
         # Add only journal handler, no console handler
-        journal_handler = JournalHandler(SYSLOG_IDENTIFIER='gpu-monitor')
+        journal_handler = SendvJournalHandler()
         journal_handler.setFormatter(logging.Formatter('%(message)s'))
+        journal_handler.setLevel(logging.INFO)
         logger.addHandler(journal_handler)
 
+# Logger implementation for this platform, resolved once at import time
+if _SYSTEM == "Windows":
+    _SYSTEM_LOGGER_CLASS = WindowsSystemLogger
+elif _SYSTEM == "Linux":
+    _SYSTEM_LOGGER_CLASS = LinuxSystemLogger
+else:
+    _SYSTEM_LOGGER_CLASS = None
+
 class GPUTemperatureMonitor(ABC):
+    __slots__ = ("_cache_ttl", "_cache_lock", "_cache_ts", "_cache_val")
+
     @classmethod
-    def create(cls) -> 'GPUTemperatureMonitor':
+    def create(cls, config: Config) -> 'GPUTemperatureMonitor':
         """Factory method to create the appropriate temperature monitor for the current platform"""
-        system = platform.system()
-        monitor_map = {
-            "Windows": WindowsGPUTemperatureMonitor,
-            "Linux": LinuxGPUTemperatureMonitor
-        }
-        
-        monitor_class = monitor_map.get(system)
-        if monitor_class is None:
-            raise NotImplementedError(f"No GPU temperature monitor implementation for platform: {system}")
+        # Prefer the in-process NVML bindings and only fall back to spawning nvidia-smi
+        # when they are not installed or the driver library cannot be initialized
+        if pynvml is not None:
+            try:
+                return NVMLGPUTemperatureMonitor(config)
+            except pynvml.NVMLError:
+                pass
+
+        if _NVIDIA_SMI_MONITOR_CLASS is None:
+            raise NotImplementedError(f"No GPU temperature monitor implementation for platform: {_SYSTEM}")
         
-        return monitor_class()
+        return _NVIDIA_SMI_MONITOR_CLASS(config)
+
+    def __init__(self, config: Config):
+        self._cache_ttl = TEMPERATURE_CACHE_TTL_SECONDS
+        self._cache_lock = threading.Lock()
+        self._cache_ts = float("-inf")
+        self._cache_val = None
+
+    @abstractmethod
+    def get_metrics(self) -> dict[int, dict]:
+        """Get a snapshot of GPU_METRIC_FIELDS for every GPU in one query, keyed by GPU index.
+        The snapshot is also kept as self.metrics."""
+        pass
+
+    def read_temperatures(self) -> dict[int, int]:
+        """Read the current temperature in Celsius of every GPU, keyed by GPU index"""
+        return {index: metrics["temperature.gpu"] for index, metrics in self.get_metrics().items()}
+
+    def get_temperatures(self) -> dict[int, int]:
+        """Get the current temperature in Celsius of every GPU, keyed by GPU index.
+        Readings younger than TEMPERATURE_CACHE_TTL_SECONDS are shared between callers and threads."""
+        with self._cache_lock:
+            now = time.monotonic()
+            if now - self._cache_ts < self._cache_ttl:
+                return self._cache_val
+            self._cache_val = self.read_temperatures()
+            # Age the reading from when it was taken, not from when the read finished
+            self._cache_ts = now
+            return self._cache_val
+
+    def get_temperature(self) -> int | None:
+        """Get the current temperature in Celsius of the hottest GPU"""
+        return max(self.get_temperatures().values())
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the next check. Returns True if a GPU event cut the wait short."""
+        time.sleep(timeout)
+        return False
+
+    def close(self) -> None:
+        """Release whatever is held open for reading the GPUs. Safe to call more than once."""
+        pass
+
+class NVMLGPUTemperatureMonitor(GPUTemperatureMonitor):
+    """Reads the GPU temperatures in-process through NVML instead of spawning nvidia-smi"""
+
+    __slots__ = ("initialized", "handles", "metrics", "gpu_event")
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        pynvml.nvmlInit()
+        self.initialized = True
+        self.handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        self.metrics = None
+        self.gpu_event = threading.Event()
+        self.start_event_watch()
+
+    def start_event_watch(self) -> None:
+        """Register for NVML events so the monitor checks right away instead of waiting for the next poll.
+        GPUs or drivers without event support (e.g. on Windows) are simply polled."""
+        try:
+            event_set = pynvml.nvmlEventSetCreate()
+        except pynvml.NVMLError:
+            return
+
+        # NVML has no temperature events. Critical XID errors are rare and often accompany a thermal
+        # fault, unlike P-state and clock events which fire constantly under load.
+        registered = False
+        for handle in self.handles:
+            try:
+                event_types = pynvml.nvmlDeviceGetSupportedEventTypes(handle) & pynvml.nvmlEventTypeXidCriticalError
+                if event_types:
+                    pynvml.nvmlDeviceRegisterEvents(handle, event_types, event_set)
+                    registered = True
+            except pynvml.NVMLError:
+                continue
+
+        if registered:
+            threading.Thread(target=self.watch_events, args=(event_set,), daemon=True).start()
+        else:
+            pynvml.nvmlEventSetFree(event_set)
+
+    def watch_events(self, event_set) -> None:
+        """Block in NVML until a registered event fires and wake up the monitor loop"""
+        while True:
+            try:
+                pynvml.nvmlEventSetWait(event_set, NVML_EVENT_WAIT_TIMEOUT_MS)
+            except pynvml.NVMLError_Timeout:
+                continue
+            except pynvml.NVMLError:
+                # Stop watching; the monitor keeps polling at the regular interval
+                return
+            self.gpu_event.set()
+
+    def wait(self, timeout: float) -> bool:
+        woken = self.gpu_event.wait(timeout)
+        self.gpu_event.clear()
+        return woken
+
+    def close(self) -> None:
+        if self.initialized:
+            self.initialized = False
+            pynvml.nvmlShutdown()
+
+    @staticmethod
+    def query_supported(query, handle):
+        """Run an NVML device query, returning None if the GPU does not support it"""
+        try:
+            return query(handle)
+        except pynvml.NVMLError_NotSupported:
+            return None
+
+    def get_metrics(self) -> dict[int, dict]:
+        metrics = {}
+        try:
+            for index, handle in enumerate(self.handles):
+                power = self.query_supported(pynvml.nvmlDeviceGetPowerUsage, handle)
+                utilization = self.query_supported(pynvml.nvmlDeviceGetUtilizationRates, handle)
+                memory = self.query_supported(pynvml.nvmlDeviceGetMemoryInfo, handle)
+                # Converted to the units nvidia-smi reports: W, % and MiB
+                metrics[index] = {
+                    "temperature.gpu": pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU),
+                    "power.draw": None if power is None else power / 1000,
+                    "utilization.gpu": None if utilization is None else utilization.gpu,
+                    "memory.used": None if memory is None else memory.used // (1024 * 1024)
+                }
+        except pynvml.NVMLError as e:
+            raise RuntimeError(f"NVML metrics query failed: {e}")
+        self.metrics = metrics
+        return metrics
+
+class NvidiaSmiGPUTemperatureMonitor(GPUTemperatureMonitor):
+    """Streams the GPU temperatures from a long-running nvidia-smi process, used when NVML is not available"""
+
+    __slots__ = ("check_interval", "_sp_kwargs", "_cmd", "proc", "metrics", "error", "metrics_ready",
+                 "last_output", "hang_reason", "closed")
+
+    # Every row also carries the GPU index and the GPU count so rows can be grouped per check
+    QUERY_FIELDS = ("index", "count") + GPU_METRIC_FIELDS
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        # nvidia-smi must sample at least as often as the monitor checks near the high threshold
+        self.check_interval = config.hot_check_interval_seconds
+        self._sp_kwargs = self.get_subprocess_kwargs()
+        self._cmd = [self.get_nvidia_smi_path(), f"--query-gpu={','.join(self.QUERY_FIELDS)}",
+                     "--format=csv,noheader,nounits", "-lms", str(self.check_interval * 1000)]
+        self.proc = None
+        self.metrics = None
+        self.error = None
+        self.metrics_ready = threading.Condition()
+        self.last_output = time.monotonic()
+        self.hang_reason = None
+        self.closed = False
+        threading.Thread(target=self.read_loop, daemon=True).start()
+        threading.Thread(target=self.health_check_loop, daemon=True).start()
 
     @abstractmethod
     def get_nvidia_smi_path(self) -> str:
@@ -222,71 +553,180 @@ class GPUTemperatureMonitor(ABC):
 
     @abstractmethod
     def get_subprocess_kwargs(self) -> dict:
-        """Return platform-specific subprocess.run kwargs"""
+        """Return platform-specific subprocess.Popen kwargs"""
         pass
 
-    def get_temperature(self) -> int | None:
-        """Get the current GPU temperature in Celsius"""
-        try:
-            result = subprocess.run(
-                [self.get_nvidia_smi_path(), "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                check=True,
-                **self.get_subprocess_kwargs()
-            )
-            return int(result.stdout.strip())
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"nvidia-smi execution failed: {e}\nOutput: {e.stdout}\nError: {e.stderr}")
-        except ValueError as e:
-            raise RuntimeError(f"Failed to parse temperature output: {e}\nOutput: {result.stdout if 'result' in locals() else 'No output'}")
+    def start_process(self) -> subprocess.Popen:
+        """Start nvidia-smi in loop mode so it prints one row per GPU every check interval"""
+        # Output is read as raw bytes: int() and float() parse the ASCII digits directly without a decode step
+        return subprocess.Popen(
+            self._cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **self._sp_kwargs
+        )
+
+    def close(self) -> None:
+        """Stop the watchdog and terminate the nvidia-smi child process if it is still running"""
+        self.closed = True
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+
+    def set_state(self, metrics: dict | None, error: str | None) -> None:
+        with self.metrics_ready:
+            self.metrics = metrics
+            self.error = error
+            self.metrics_ready.notify_all()
+
+    def parse_line(self, line: bytes) -> tuple[int, int, dict]:
+        """Parse one nvidia-smi CSV row into (GPU index, GPU count, metrics keyed by GPU_METRIC_FIELDS)"""
+        values = line.strip().split(b", ")
+        if len(values) != len(self.QUERY_FIELDS):
+            raise ValueError(f"expected {len(self.QUERY_FIELDS)} values, got {len(values)}")
+        index, count, *metric_values = values
+        metrics = {field: parse_metric_value(value) for field, value in zip(GPU_METRIC_FIELDS, metric_values)}
+        # Only the optional metrics may be unavailable, the monitor cannot work without a temperature
+        if metrics["temperature.gpu"] is None:
+            raise ValueError(f"temperature of GPU {int(index)} is unavailable")
+        return int(index), int(count), metrics
+
+    def read_loop(self) -> None:
+        """Watchdog that keeps the latest nvidia-smi metrics and restarts the process whenever it exits"""
+        while not self.closed:
+            try:
+                self.proc = self.start_process()
+            except (OSError, RuntimeError) as e:
+                self.set_state(None, f"Failed to start nvidia-smi: {e}")
+                time.sleep(self.check_interval)
+                continue
+
+            # Drain stderr while nvidia-smi runs so warnings cannot fill the pipe and block it,
+            # keeping only the last lines for the error report
+            stderr_tail = collections.deque(maxlen=20)
+            stderr_reader = threading.Thread(target=stderr_tail.extend, args=(self.proc.stderr,), daemon=True)
+            stderr_reader.start()
+
+            # nvidia-smi prints one row per GPU on every loop iteration; publish once all rows arrived
+            rows = {}
+            for line in self.proc.stdout:
+                self.last_output = time.monotonic()
+                try:
+                    index, count, metrics = self.parse_line(line)
+                except ValueError as e:
+                    rows = {}
+                    self.set_state(None, f"Failed to parse nvidia-smi output: {e}\nOutput: {line.decode(errors='replace')}")
+                    continue
+
+                if index in rows:
+                    rows = {}
+                rows[index] = metrics
+                if len(rows) == count:
+                    self.set_state(rows, None)
+                    rows = {}
+
+            # EOF: nvidia-smi exited, report why and restart it after one interval
+            returncode = self.proc.wait()
+            stderr_reader.join(timeout=1)
+            stderr = b"".join(stderr_tail)[-2000:].decode(errors="replace")
+            reason, self.hang_reason = self.hang_reason or f"exited with code {returncode}", None
+            self.set_state(None, f"nvidia-smi execution failed: {reason}\nError: {stderr}")
+            time.sleep(self.check_interval)
+
+    def health_check_loop(self) -> None:
+        """Kill nvidia-smi when it hangs without printing, so read_loop sees EOF and restarts it"""
+        timeout = 2 * self.check_interval
+        while not self.closed:
+            time.sleep(self.check_interval)
+            proc = self.proc
+            if proc is not None and proc.poll() is None and time.monotonic() - self.last_output > timeout:
+                self.hang_reason = f"produced no output for {timeout} seconds and was killed"
+                proc.kill()
+                # Give the restarted process a full timeout before checking it again
+                self.last_output = time.monotonic()
+
+    def get_metrics(self) -> dict[int, dict]:
+        """Get the most recent GPU metrics reported by nvidia-smi"""
+        with self.metrics_ready:
+            # Only the very first call has to wait for nvidia-smi to print its first rows
+            if not self.metrics_ready.wait_for(lambda: self.metrics is not None or self.error is not None,
+                                               timeout=2 * self.check_interval):
+                raise RuntimeError("Timed out waiting for nvidia-smi output")
+            metrics, error = self.metrics, self.error
+
+        if error is not None:
+            raise RuntimeError(error)
+        return metrics
+
+class WindowsGPUTemperatureMonitor(NvidiaSmiGPUTemperatureMonitor):
+    __slots__ = ()
+
+    # Resolved nvidia-smi.exe path, shared by all instances once found
+    _NVIDIA_SMI_PATH = None
+
+    def __init__(self, config: Config):
+        # Probe the candidate locations once instead of every time the path is needed
+        if WindowsGPUTemperatureMonitor._NVIDIA_SMI_PATH is None:
+            WindowsGPUTemperatureMonitor._NVIDIA_SMI_PATH = self.find_nvidia_smi_path()
+        super().__init__(config)
 
-class WindowsGPUTemperatureMonitor(GPUTemperatureMonitor):
     def get_nvidia_smi_path(self) -> str:
+        return self._NVIDIA_SMI_PATH
+
+    def find_nvidia_smi_path(self) -> str:
         nvidia_smi_paths = [
             r"C:\Program Files\NVIDIA Corporation\NVSMI\nvidia-smi.exe",
             r"C:\Windows\System32\nvidia-smi.exe",
-            "nvidia-smi"  # Try PATH as fallback
+            shutil.which("nvidia-smi")  # Try PATH as fallback
         ]
         
-        for path in nvidia_smi_paths:
-            try:
-                # Just check if the file exists and is executable
-                subprocess.run([path, "--version"], capture_output=True, check=True, **self.get_subprocess_kwargs())
-                return path
-            except FileNotFoundError:
-                continue
-            except subprocess.SubprocessError:
-                # If we get here, the file exists but failed to execute
-                return path
-        
-        raise RuntimeError("Could not find nvidia-smi.exe in any of the common locations")
+        # Check for the file first and only run the one that was found
+        path = next((path for path in nvidia_smi_paths if path and os.path.isfile(path)), None)
+        if path is None:
+            raise RuntimeError("Could not find nvidia-smi.exe in any of the common locations")
+
+        try:
+            subprocess.run([path, "--version"], capture_output=True, check=True, **self.get_subprocess_kwargs())
+        except OSError as e:
+            raise RuntimeError(f"Found nvidia-smi at {path} but could not execute it: {e}")
+        except subprocess.SubprocessError:
+            # The file exists and runs but failed, the monitor reports the actual error later
+            pass
+        return path
 
     def get_subprocess_kwargs(self) -> dict:
         return {"creationflags": subprocess.CREATE_NO_WINDOW}
 
-class LinuxGPUTemperatureMonitor(GPUTemperatureMonitor):
+class LinuxGPUTemperatureMonitor(NvidiaSmiGPUTemperatureMonitor):
+    __slots__ = ()
+
     def get_nvidia_smi_path(self) -> str:
-        return "nvidia-smi"
+        # subprocess only uses posix_spawn() when the executable is given with a directory
+        return shutil.which("nvidia-smi") or "nvidia-smi"
 
     def get_subprocess_kwargs(self) -> dict:
-        return {}
+        # Let subprocess start nvidia-smi with posix_spawn() instead of fork()+exec(), which
+        # requires close_fds=False. Descriptors opened by Python are non-inheritable by
+        # default (PEP 446), so the child still does not inherit them.
+        return {"close_fds": False}
+
+# nvidia-smi based temperature monitor for this platform, resolved once at import time
+if _SYSTEM == "Windows":
+    _NVIDIA_SMI_MONITOR_CLASS = WindowsGPUTemperatureMonitor
+elif _SYSTEM == "Linux":
+    _NVIDIA_SMI_MONITOR_CLASS = LinuxGPUTemperatureMonitor
+else:
+    _NVIDIA_SMI_MONITOR_CLASS = None
 
 class SystemShutdown(ABC):
+    __slots__ = ()
+
     @classmethod
     def create(cls) -> 'SystemShutdown':
         """Factory method to create the appropriate shutdown handler for the current platform"""
-        system = platform.system()
-        shutdown_map = {
-            "Windows": WindowsSystemShutdown,
-            "Linux": LinuxSystemShutdown
-        }
-        
-        shutdown_class = shutdown_map.get(system)
-        if shutdown_class is None:
-            raise NotImplementedError(f"No shutdown implementation for platform: {system}")
-        
-        return shutdown_class()
+        if _SYSTEM_SHUTDOWN_CLASS is None:
+            raise NotImplementedError(f"No shutdown implementation for platform: {_SYSTEM}")
+        return _SYSTEM_SHUTDOWN_CLASS()
 
     @abstractmethod
     def shutdown(self) -> None:
@@ -294,42 +734,180 @@ class SystemShutdown(ABC):
         pass
 
 class WindowsSystemShutdown(SystemShutdown):
+    __slots__ = ()
+
     def shutdown(self) -> None:
         subprocess.run(["shutdown", "/s", "/t", "0"], check=True)
 
 class LinuxSystemShutdown(SystemShutdown):
+    __slots__ = ()
+
     def shutdown(self) -> None:
         subprocess.run(["shutdown", "-h", "now"], check=True)
 
+# Shutdown implementation for this platform, resolved once at import time
+if _SYSTEM == "Windows":
+    _SYSTEM_SHUTDOWN_CLASS = WindowsSystemShutdown
+elif _SYSTEM == "Linux":
+    _SYSTEM_SHUTDOWN_CLASS = LinuxSystemShutdown
+else:
+    _SYSTEM_SHUTDOWN_CLASS = None
+
 class GPUMonitor:
-    def __init__(self, logger: logging.Logger):
+    __slots__ = ("logger", "config", "temperature_monitor", "shutdown_handler", "_crit_deadline_ns", "_emergency_ns",
+                 "_alert_level", "_last_notify_ts", "_session", "_gotify_endpoint", "_gotify_headers",
+                 "_notify_q", "_pending", "_pending_lock", "_flush_requested", "_fail_count", "_breaker_until")
+
+    # Alert levels ordered by severity, used to always notify when the level rises
+    ALERT_SEVERITY = {None: 0, "high": 1, "critical": 2}
+
+    def __init__(self, logger: logging.Logger, config: Config):
         self.logger = logger
-        self.temperature_monitor = GPUTemperatureMonitor.create()
+        self.config = config
+        self.temperature_monitor = GPUTemperatureMonitor.create(config)
         self.shutdown_handler = SystemShutdown.create()
-        self.critical_temp_start_time = None
+        # Monotonic deadline for the emergency shutdown, set when the temperature turns critical
+        self._crit_deadline_ns = None
+        self._emergency_ns = config.emergency_shutdown_duration_seconds * 1_000_000_000
+        self._alert_level = None
+        self._last_notify_ts = {"high": float("-inf"), "critical": float("-inf")}
+
+        # Reuse one keep-alive connection to Gotify instead of reconnecting for every notification
+        # requests is only needed once the monitor runs, so it is not imported at module load
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=Retry(total=2, backoff_factor=0.2))
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._gotify_endpoint = f"{config.gotify.url}/message"
+        self._gotify_headers = {"X-Gotify-Key": config.gotify.token, "Content-Type": "application/json"}
+        # Circuit breaker state, only touched by the notification worker
+        self._fail_count = 0
+        self._breaker_until = float("-inf")
+
+        # Notifications are posted by a background worker so a slow or unreachable
+        # Gotify server never delays temperature checks. The queue holds titles, the
+        # notifications themselves wait in _pending where repeats are merged.
+        self._notify_q = queue.Queue(maxsize=64)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        threading.Thread(target=self._notify_worker, daemon=True).start()
+
+    def send_gotify_notification(self, title: str, message: str, priority: int = 5,
+                                 temperature: int | None = None) -> bool:
+        """Queue a notification for the background worker without blocking.
+        A notification whose title is already waiting to be sent is merged into the queued one."""
+        with self._pending_lock:
+            pending = self._pending.get(title)
+            if pending is not None:
+                pending.message = message
+                pending.priority = max(pending.priority, priority)
+                if temperature is not None and (pending.max_temperature is None or temperature > pending.max_temperature):
+                    pending.max_temperature = temperature
+                pending.count += 1
+                return True
+            # Store the notification before queueing its title so the worker always finds it
+            self._pending[title] = PendingNotification(message, priority, temperature, time.monotonic())
+            try:
+                self._notify_q.put_nowait(title)
+            except queue.Full:
+                del self._pending[title]
+                self.logger.error("Notification queue is full, dropping notification: %s", title)
+                return False
+        return True
+
+    def flush_notifications(self, timeout: float) -> None:
+        """Wait up to timeout seconds for the queued notifications to be sent"""
+        deadline = time.monotonic() + timeout
+        # Cut the batch window short so the worker sends right away
+        self._flush_requested.set()
+        try:
+            with self._notify_q.all_tasks_done:
+                while self._notify_q.unfinished_tasks:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._notify_q.all_tasks_done.wait(remaining)
+        finally:
+            self._flush_requested.clear()
+
+    def _notify_worker(self) -> None:
+        batch_window = self.config.notify_batch_window_seconds
+        while True:
+            titles = [self._notify_q.get()]
+            # Give repeats of the same alert a moment to be merged before sending, then
+            # send everything that queued up in the meantime in one go
+            if batch_window > 0:
+                self._flush_requested.wait(batch_window)
+            while True:
+                try:
+                    titles.append(self._notify_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            for title in titles:
+                try:
+                    with self._pending_lock:
+                        pending = self._pending.pop(title, None)
+                    if pending is None:
+                        continue
+                    message = pending.message
+                    if pending.count > 1:
+                        summary = f"x{pending.count} in {time.monotonic() - pending.first_queued:.0f}s"
+                        if pending.max_temperature is not None:
+                            summary += f", max {pending.max_temperature}°C"
+                        message = f"{message}\n({summary})"
+                    self.post_gotify_notification(title, message, pending.priority)
+                except Exception:
+                    # Keep the worker alive, otherwise every later notification would pile up unsent
+                    self.logger.exception("Unexpected error while sending notification: %s", title)
+                finally:
+                    self._notify_q.task_done()
+
+    def post_gotify_notification(self, title: str, message: str, priority: int = 5) -> bool:
+        """Post a notification to Gotify. While Gotify keeps failing, notifications are skipped
+        with an exponential backoff instead of waiting for every request to time out."""
+        if time.monotonic() < self._breaker_until:
+            self.logger.warning("Gotify is unavailable, skipping notification: %s", title)
+            return False
 
-    def send_gotify_notification(self, title: str, message: str, priority: int = 5) -> bool:
         try:
-            response = requests.post(
-                f"{GOTIFY_SERVER_URL}/message",
-                headers={"X-Gotify-Key": GOTIFY_TOKEN},
-                json={
+            response = self._session.post(
+                self._gotify_endpoint,
+                headers=self._gotify_headers,
+                # Serialized here so requests does not run its own JSON encoder on every notification
+                data=json_dumps({
                     "title": title,
                     "message": message,
                     "priority": priority
-                }
+                }),
+                timeout=GOTIFY_TIMEOUT_SECONDS
             )
             response.raise_for_status()
-            return True
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to send notification: {e}")
+        # requests.exceptions.RequestException derives from OSError
+        except OSError as e:
+            self.logger.error("Failed to send notification: %s", e)
+            self._fail_count += 1
+            if self._fail_count >= NOTIFY_BREAKER_THRESHOLD:
+                self._breaker_until = time.monotonic() + min(NOTIFY_BREAKER_MAX_BACKOFF_SECONDS, 2 ** self._fail_count)
             return False
 
-    def get_gpu_temperature(self) -> int | None:
+        self._fail_count = 0
+        return True
+
+    def get_gpu_temperature(self) -> tuple[int, int] | None:
+        """Return the index and temperature of the hottest GPU, or None if the temperatures could not be read"""
         try:
-            return self.temperature_monitor.get_temperature()
+            # Every check needs a fresh reading, the cache is only for other callers
+            temperatures = self.temperature_monitor.read_temperatures()
+            gpu = max(temperatures, key=temperatures.get)
+            return gpu, temperatures[gpu]
         except (RuntimeError, ValueError) as e:
-            self.logger.error(str(e))
+            self.logger.error("%s", e)
             self.send_gotify_notification(
                 "GPU Monitor Error",
                 f"Failed to get GPU temperature. Please check system.\nDetails: {str(e)}",
@@ -337,113 +915,168 @@ class GPUMonitor:
             )
             return None
 
-    def check_emergency_shutdown(self, temperature: int) -> None:
-        """Check if emergency shutdown is needed. Only called with valid temperature values."""
-        current_time = time.time()
-        
-        if temperature >= CRITICAL_TEMPERATURE_THRESHOLD:
-            if self.critical_temp_start_time is None:
-                self.critical_temp_start_time = current_time
-                self.logger.warning(
-                    f"CRITICAL temperature detected ({temperature}°C). Emergency shutdown will trigger in {EMERGENCY_SHUTDOWN_DURATION_SECONDS} seconds "
-                    f"if temperature remains critical."
-                )
-            elif current_time - self.critical_temp_start_time >= EMERGENCY_SHUTDOWN_DURATION_SECONDS:
-                self.logger.critical("EMERGENCY: Temperature has been critical for too long. Initiating system shutdown!")
-                self.send_gotify_notification(
-                    "EMERGENCY SHUTDOWN",
-                    f"GPU temperature has been critically high ({temperature}°C) for {EMERGENCY_SHUTDOWN_DURATION_SECONDS} seconds. System will shutdown NOW!",
-                    priority=10
-                )
-                self.shutdown_handler.shutdown()
-        else:
-            self.critical_temp_start_time = None
+    def should_notify(self, level: str | None) -> bool:
+        """Record the current alert level and decide whether it warrants a notification.
+        Alerts are sent when the level rises, otherwise at most once every notify_min_interval_seconds per level."""
+        escalated = self.ALERT_SEVERITY[level] > self.ALERT_SEVERITY[self._alert_level]
+        self._alert_level = level
+        if level is None:
+            return False
+
+        now = time.monotonic()
+        if escalated or now - self._last_notify_ts[level] >= self.config.notify_min_interval_seconds:
+            self._last_notify_ts[level] = now
+            return True
+        return False
+
+    def _on_critical(self, temperature: int, gpu: int, now_ns: int) -> None:
+        """Track a critical temperature reading and shut down if it has lasted too long.
+        The monitor loop resets _crit_deadline_ns itself once the temperature drops."""
+        shutdown_duration = self.config.emergency_shutdown_duration_seconds
+        if self._crit_deadline_ns is None:
+            self._crit_deadline_ns = now_ns + self._emergency_ns
+            self.logger.warning(
+                "CRITICAL temperature detected on GPU %d (%d°C). Emergency shutdown will trigger in %d seconds "
+                "if temperature remains critical.",
+                gpu, temperature, shutdown_duration
+            )
+        elif now_ns >= self._crit_deadline_ns:
+            self.logger.critical("EMERGENCY: Temperature has been critical for too long. Initiating system shutdown!")
+            self.send_gotify_notification(
+                "EMERGENCY SHUTDOWN",
+                f"GPU {gpu} temperature has been critically high ({temperature}°C) for {shutdown_duration} seconds. System will shutdown NOW!",
+                priority=10
+            )
+            self.flush_notifications(NOTIFICATION_FLUSH_TIMEOUT_SECONDS)
+            self.shutdown_handler.shutdown()
 
     def monitor(self):
-        self.logger.info(f"Starting GPU temperature monitor on {platform.system()}...")
+        self.logger.info("Starting GPU temperature monitor on %s...", _SYSTEM)
         
+        # Bind the configuration and bound methods used on every check to locals once
+        high = self.config.high_temperature_threshold
+        crit = self.config.critical_temperature_threshold
+        # Poll at the configured interval near the high threshold and back off while the GPU is cool
+        hot_interval = self.config.hot_check_interval_seconds
+        cool_interval = self.config.cool_check_interval_seconds
+        backoff_below = high - ADAPTIVE_INTERVAL_MARGIN_CELSIUS
+        # The log level is fixed once logging is set up, so check it once instead of on every reading
+        log_temperature = self.logger.isEnabledFor(logging.INFO)
+        log_info = self.logger.info
+        log_warn = self.logger.warning
+        notify = self.send_gotify_notification
+        should_notify = self.should_notify
+        get_temp = self.get_gpu_temperature
+        on_critical = self._on_critical
+        monotonic = time.monotonic
+        monotonic_ns = time.monotonic_ns
+        wait = self.temperature_monitor.wait
+
+        # Schedule checks against monotonic deadlines so the time spent reading the
+        # temperature and sending notifications does not stretch the interval
+        next_check = monotonic()
         while True:
-            temperature = self.get_gpu_temperature()
-            if temperature is not None:
-                self.logger.info(f"Current GPU temperature: {temperature}°C")
+            interval = hot_interval
+            reading = get_temp()
+            if reading is not None:
+                gpu, temperature = reading
+                if log_temperature:
+                    log_info("Current GPU temperature: %d°C (GPU %d)", temperature, gpu)
                 
-                if temperature >= HIGH_TEMPERATURE_THRESHOLD:
-                    if temperature >= CRITICAL_TEMPERATURE_THRESHOLD:
-                        self.logger.warning(f"CRITICAL temperature detected: {temperature}°C")
-                        self.send_gotify_notification(
-                            "CRITICAL GPU Temperature Alert",
-                            f"GPU temperature is CRITICALLY high: {temperature}°C!",
-                            priority=8
+                if temperature >= crit:
+                    log_warn("CRITICAL temperature detected on GPU %d: %d°C", gpu, temperature)
+                    if should_notify("critical"):
+                        notify(
+                            f"CRITICAL GPU {gpu} Temperature Alert",
+                            f"GPU {gpu} temperature is CRITICALLY high: {temperature}°C!",
+                            priority=8,
+                            temperature=temperature
                         )
+                    on_critical(temperature, gpu, monotonic_ns())
+                else:
+                    self._crit_deadline_ns = None
+                    if temperature >= high:
+                        log_warn("High temperature detected on GPU %d: %d°C", gpu, temperature)
+                        if should_notify("high"):
+                            notify(
+                                f"High GPU {gpu} Temperature Alert",
+                                f"GPU {gpu} temperature is high: {temperature}°C",
+                                priority=5,
+                                temperature=temperature
+                            )
                     else:
-                        self.logger.warning(f"High temperature detected: {temperature}°C")
-                        self.send_gotify_notification(
-                            "High GPU Temperature Alert",
-                            f"GPU temperature is high: {temperature}°C",
-                            priority=5
-                        )
-                
-                self.check_emergency_shutdown(temperature)
+                        should_notify(None)
+                        if temperature < backoff_below:
+                            interval = cool_interval
             
-            time.sleep(CHECK_INTERVAL_SECONDS)
+            next_check += interval
+            now = monotonic()
+            if now - next_check > interval:
+                # More than a whole interval behind: resume from now instead of catching up
+                next_check = now
+            if wait(max(0.0, next_check - now)):
+                # Woken early by a GPU event: check now and restart the schedule from here
+                next_check = monotonic()
 
 class ProcessManager(ABC):
     """Base class for process management and daemonization."""
+
+    __slots__ = ("logger",)
     
     @classmethod
     def create(cls, logger: logging.Logger) -> 'ProcessManager':
         """Factory method to create the appropriate process manager for the current platform and environment"""
-        system = platform.system()
-        
         # If we're running under systemd, use the systemd manager regardless of platform
         if os.getenv('INVOCATION_ID') is not None:  # systemd sets this
             return SystemdProcessManager(logger)
             
-        # Otherwise use platform-specific manager
-        manager_map = {
-            "Windows": DaemonikerProcessManager,
-            "Linux": DaemonikerProcessManager  # We can use Daemoniker on Linux when not under systemd
-        }
-        
-        manager_class = manager_map.get(system)
-        if manager_class is None:
-            raise NotImplementedError(f"No process manager implementation for platform: {system}")
-        
-        return manager_class(logger)
+        # Otherwise use platform-specific manager. We can use Daemoniker on Linux when not under systemd
+        if _SYSTEM in ("Windows", "Linux"):
+            return DaemonikerProcessManager(logger)
+        raise NotImplementedError(f"No process manager implementation for platform: {_SYSTEM}")
 
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
     @abstractmethod
-    def daemonize(self) -> None:
-        """Handle process daemonization"""
+    def daemonize(self, config: Config) -> Config:
+        """Handle process daemonization and return the configuration for the daemon process"""
         pass
 
 class SystemdProcessManager(ProcessManager):
     """Process manager for systemd services - no daemonization needed"""
+
+    __slots__ = ()
     
-    def daemonize(self) -> None:
+    def daemonize(self, config: Config) -> Config:
         """Under systemd, we don't need to daemonize"""
         self.logger.info("Starting under systemd control...")
+        return config
 
 class DaemonikerProcessManager(ProcessManager):
     """Process manager using Daemoniker for cross-platform daemonization"""
+
+    __slots__ = ()
     
-    def daemonize(self) -> None:
+    def daemonize(self, config: Config) -> Config:
+        # Only imported when actually daemonizing, never under systemd
+        from daemoniker import Daemonizer
+
         with Daemonizer() as (is_setup, daemonizer):
             if is_setup:
                 self.logger.info("Starting GPU temperature monitor...")
                 
-                if platform.system() == "Windows":
+                if _SYSTEM == "Windows":
                     # On Windows, we need to set up a handler for Ctrl+C events
-                    import win32api
                     def win32_handler(type):
                         return True
                     win32api.SetConsoleCtrlHandler(win32_handler, True)
             
-            is_parent, new_logger = daemonizer(
-                PID_FILE,
-                self.logger
+            # The configuration is handed over to the daemon instead of re-reading the .env file there
+            is_parent, new_logger, config = daemonizer(
+                config.pid_file,
+                self.logger,
+                config
             )
             
             if is_parent:
@@ -453,11 +1086,14 @@ class DaemonikerProcessManager(ProcessManager):
             
             # Update logger with the new one from daemonizer
             self.logger = new_logger
+            return config
 
 def setup_logging() -> logging.Logger:
     """Setup and return a configured logger"""
     logger = logging.getLogger('gpu-monitor')
     logger.setLevel(logging.INFO)
+    # Records are only emitted by our own handler, never duplicated up to the root logger
+    logger.propagate = False
 
     try:
         system_logger = SystemLogger.create()
@@ -470,35 +1106,42 @@ def setup_logging() -> logging.Logger:
 
 def setup_signal_handlers(monitor: GPUMonitor, logger: logging.Logger):
     """Set up signal handlers for graceful shutdown"""
+    # Cleanup can be reached from both a console control handler and atexit, run it only once
+    cleanup_lock = threading.Lock()
+
     def cleanup():
+        if not cleanup_lock.acquire(blocking=False):
+            return
         logger.info("Cleaning up before exit...")
         try:
-            os.remove(PID_FILE)
+            os.remove(monitor.config.pid_file)
             logger.info("Removed PID file")
         except (OSError, IOError) as e:
-            logger.warning(f"Failed to remove PID file: {e}")
+            logger.warning("Failed to remove PID file: %s", e)
         
         monitor.send_gotify_notification(
             "GPU Monitor Stopping",
             "The GPU temperature monitor service is shutting down.",
             priority=3
         )
+        monitor.flush_notifications(NOTIFICATION_FLUSH_TIMEOUT_SECONDS)
+        monitor.temperature_monitor.close()
 
-    def handle_signal(signum):
-        logger.info(f"Received signal {signum}, shutting down gracefully...")
-        cleanup()
+    def handle_signal(signum, frame):
+        logger.info("Received signal %s, shutting down gracefully...", signum)
+        # Python runs signal handlers in the main thread, so SystemExit ends the monitor
+        # loop's wait right away. The cleanup then runs from atexit.
         sys.exit(0)
 
-    if platform.system() == "Windows":
-        import win32api
-        import win32con
-        
+    if _SYSTEM == "Windows":
         def win32_handler(type):
-            if type in (win32con.CTRL_C_EVENT, 
-                       win32con.CTRL_BREAK_EVENT,
-                       win32con.CTRL_CLOSE_EVENT,
+            # Ctrl+C and Ctrl+Break are left to the SIGINT/SIGBREAK handlers below, which exit the
+            # process and clean up through atexit. Returning True for them would keep the process
+            # running on a closed temperature monitor.
+            if type in (win32con.CTRL_CLOSE_EVENT,
                        win32con.CTRL_LOGOFF_EVENT,
                        win32con.CTRL_SHUTDOWN_EVENT):
+                # Windows ends the process once this handler returns
                 cleanup()
                 return True
             return False
@@ -506,32 +1149,28 @@ def setup_signal_handlers(monitor: GPUMonitor, logger: logging.Logger):
         win32api.SetConsoleCtrlHandler(win32_handler, True)
     
     # Register signal handlers directly
-    SignalHandler1(signal.SIGTERM, lambda *args: handle_signal(signal.SIGTERM))
-    SignalHandler1(signal.SIGINT, lambda *args: handle_signal(signal.SIGINT))
-    if platform.system() == "Windows":
-        SignalHandler1(signal.SIGBREAK, lambda *args: handle_signal(signal.SIGBREAK))
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+    if _SYSTEM == "Windows":
+        signal.signal(signal.SIGBREAK, handle_signal)
 
     # Register cleanup on normal exit
-    import atexit
     atexit.register(cleanup)
 
 def main():
     """Entry point for the GPU temperature monitor"""
     logger = setup_logging()
-    load_environment(logger)
+    config = load_environment(logger)
     try:
         # Create appropriate process manager
         process_manager = ProcessManager.create(logger)
         
         # Handle daemonization
-        process_manager.daemonize()
+        config = process_manager.daemonize(config)
         logger = process_manager.logger  # Get potentially updated logger
         
-        # Load environment in the child process
-        load_environment(logger)
-        
         # Common code for all platforms after daemonization
-        monitor = GPUMonitor(logger)
+        monitor = GPUMonitor(logger, config)
         setup_signal_handlers(monitor, logger)
         
         try:
@@ -555,7 +1194,7 @@ def main():
             raise  # Re-raise to trigger the outer exception handler
         
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
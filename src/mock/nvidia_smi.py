@@ -1,20 +1,58 @@
-#!/usr/bin/env python3
-import sys
-import random
-import time
-
-def mock_temperature():
-    # Simulate a somewhat realistic GPU temperature between 30°C and 90°C
-    return random.randint(30, 90)
-
-if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "--version":
-        print("NVIDIA-SMI 535.129.03   Driver Version: 535.129.03   CUDA Version: 12.2")
-        sys.exit(0)
-    
-    if len(sys.argv) > 1 and sys.argv[1] == "--query-gpu=temperature.gpu" and sys.argv[2] == "--format=csv,noheader,nounits":
-        print(mock_temperature())
-        sys.exit(0)
-    
-    print("Invalid arguments. This is a mock nvidia-smi that only supports temperature queries.")
-    sys.exit(1) 
\ No newline at end of file
+#!/usr/bin/env python3
+import os
+import sys
+import random
+import time
+
+def mock_temperature():
+    # Simulate a somewhat realistic GPU temperature between 30°C and 90°C
+    return random.randint(30, 90)
+
+# Number of GPUs to simulate, one output row each
+GPU_COUNT = int(os.getenv("MOCK_GPU_COUNT", "1"))
+
+# Mock values for the supported --query-gpu fields of one GPU, in nvidia-smi nounits format
+MOCK_METRICS = {
+    "index": lambda index: str(index),
+    "count": lambda index: str(GPU_COUNT),
+    "temperature.gpu": lambda index: str(mock_temperature()),
+    "power.draw": lambda index: f"{random.uniform(20, 250):.2f}",
+    "utilization.gpu": lambda index: str(random.randint(0, 100)),
+    "memory.used": lambda index: str(random.randint(0, 8192))
+}
+
+def print_rows(fields):
+    # Emit all GPU rows of one sample in a single write, like nvidia-smi does per loop iteration
+    rows = "".join(", ".join(MOCK_METRICS[field](index) for field in fields) + "\n" for index in range(GPU_COUNT))
+    sys.stdout.write(rows)
+    sys.stdout.flush()
+
+def loop_interval_seconds(args):
+    # Mirror nvidia-smi's loop modes: -l/--loop in seconds, -lms/--loop-ms in milliseconds
+    for flag, scale in (("-l", 1), ("--loop", 1), ("-lms", 0.001), ("--loop-ms", 0.001)):
+        if flag in args:
+            return int(args[args.index(flag) + 1]) * scale
+    return None
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--version":
+        print("NVIDIA-SMI 535.129.03   Driver Version: 535.129.03   CUDA Version: 12.2")
+        sys.exit(0)
+
+    if len(sys.argv) > 2 and sys.argv[1].startswith("--query-gpu=") and sys.argv[2] == "--format=csv,noheader,nounits":
+        fields = sys.argv[1][len("--query-gpu="):].split(",")
+        if all(field in MOCK_METRICS for field in fields):
+            interval = loop_interval_seconds(sys.argv[3:])
+            if interval is None:
+                print_rows(fields)
+                sys.exit(0)
+
+            try:
+                while True:
+                    print_rows(fields)
+                    time.sleep(interval)
+            except (KeyboardInterrupt, BrokenPipeError):
+                sys.exit(0)
+
+    print("Invalid arguments. This is a mock nvidia-smi that only supports GPU metric queries.")
+    sys.exit(1)